@@ -1,6 +1,8 @@
 import asyncio
 import os
+from functools import lru_cache
 
+import aiofiles
 import google.generativeai as genai
 from dotenv import dotenv_values
 
@@ -9,10 +11,14 @@ from models.paper_model import SamplePaper
 env = dotenv_values(".env")
 
 
+@lru_cache(maxsize=256)
 def determine_file_type(filename):
     """
     Determines the type of the file based on its extension.
 
+    The result is memoized per filename, so repeated uploads of the same
+    name skip the extension parsing entirely.
+
     Args:
         filename (str): The name of the file.
 
@@ -28,12 +34,15 @@ def determine_file_type(filename):
         return "unknown"
 
 
-async def store_file_in_local_dir(file_object, original_filename):
+async def store_file_in_local_dir(file, original_filename):
     """
-    Stores the uploaded file in the local directory.
+    Streams the uploaded file to the local directory in chunks.
+
+    Copying 1 MiB at a time keeps resident memory bounded by the chunk size
+    instead of buffering the entire upload in memory before writing.
 
     Args:
-        file_object (bytes): The content of the file to be stored.
+        file (UploadFile): The uploaded file to be stored.
         original_filename (str): The original filename of the uploaded file.
 
     Returns:
@@ -42,8 +51,9 @@ async def store_file_in_local_dir(file_object, original_filename):
     file_path = os.path.join(
         os.path.abspath(os.curdir), "file_upload", original_filename
     )
-    with open(file_path, "wb") as out_file:
-        out_file.write(file_object)
+    async with aiofiles.open(file_path, "wb") as out_file:
+        while chunk := await file.read(1 << 20):
+            await out_file.write(chunk)
     return file_path
 
 
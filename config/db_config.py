@@ -1,8 +1,22 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
+
 from helper.helper import DBUri
 
 # Initialize the MongoDB client using the URI specified in the DBUri class.
-client = AsyncIOMotorClient(DBUri.MONGO_DB_URI)
+# PyMongo's native asyncio client talks to the event loop directly instead of
+# hopping through motor's thread-pool executor on every query.
+#
+# The pool is sized for bursty event-loop concurrency, writes ack on the
+# primary only (w=1) instead of waiting for a majority, and zstd compresses
+# the paper payloads on the wire.
+client = AsyncMongoClient(
+    DBUri.MONGO_DB_URI,
+    maxPoolSize=256,
+    minPoolSize=16,
+    w=1,
+    retryWrites=True,
+    compressors="zstd",
+)
 
 # Reference to the 'sample_papers_db' database.
 db = client.sample_papers_db
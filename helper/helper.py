@@ -1,6 +1,35 @@
+from functools import lru_cache
 from typing import Any
 
-from models.paper_model import StandardResponse
+import orjson
+from starlette.responses import Response
+
+
+@lru_cache(maxsize=64)
+def envelope_prefix(code: int, status: str, message: str) -> bytes:
+    """
+    Builds the serialized response envelope up to the data payload.
+
+    The handlers use a small, fixed set of (code, status, message) combos, so
+    the prefix bytes are memoized and each response only serializes its data.
+
+    Args:
+        code (int): The response code of the envelope.
+        status (str): The status string of the envelope.
+        message (str): The message string of the envelope.
+
+    Returns:
+        bytes: The envelope JSON up to and including the '"data":' key.
+    """
+    return (
+        b'{"code":'
+        + str(code).encode()
+        + b',"status":'
+        + orjson.dumps(status)
+        + b',"message":'
+        + orjson.dumps(message)
+        + b',"data":'
+    )
 
 
 class DBUri:
@@ -14,15 +43,31 @@ class DBUri:
     MONGO_DB_URI = "mongodb://localhost:27017/"
 
 
+class CacheConfig:
+    """
+    Contains the Redis cache settings.
+
+    Attributes:
+        CACHE_TTL_SECONDS (int): How long cached papers stay in Redis before
+                                 expiring, keeping the cache's memory bounded.
+    """
+
+    CACHE_TTL_SECONDS = 3600
+
+
 class CustomStandard:
     """
     Provides a standardized response structure for API responses.
     """
 
     @staticmethod
-    def response(code: int, status: str, message: str, data: Any = None) -> dict:
+    def response(code: int, status: str, message: str, data: Any = None) -> Response:
         """
-        Creates a standardized response dictionary using the StandardResponse model.
+        Creates a standardized, pre-serialized JSON response.
+
+        The fixed part of the envelope comes from the memoized prefix, so the
+        hot path only serializes the data payload and concatenates bytes — no
+        wrapper model or dict is built per request.
 
         Args:
             code (int): The response code indicating the result of the operation (e.g., 200 for success, 404 for not found).
@@ -31,8 +76,8 @@ class CustomStandard:
             data (Any, optional): The data payload to include in the response. Defaults to None.
 
         Returns:
-            dict: A dictionary representation of the standardized response, containing the fields 'code', 'status', 'message', and 'data'.
+            Response: A ready JSON response whose HTTP status mirrors `code`,
+                      containing the fields 'code', 'status', 'message', and 'data'.
         """
-        return StandardResponse(
-            code=code, status=status, message=message, data=data
-        ).model_dump()
+        body = envelope_prefix(code, status, message) + orjson.dumps(data) + b"}"
+        return Response(content=body, status_code=code, media_type="application/json")
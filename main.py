@@ -1,8 +1,30 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
-from routes.paper_routes import router
+from fastapi.responses import ORJSONResponse
+
+from config.db_config import db, papers_collection
+from routes.paper_routes import redis_client, router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Manages application startup and shutdown.
+
+    On startup, ensures the unique indexes on the paper and task lookup keys
+    exist so `find_one` queries hit a B-tree instead of scanning the
+    collection. On shutdown, closes the shared Redis connection pool so no
+    connections are leaked when the server stops.
+    """
+    await papers_collection.create_index("p_id", unique=True)
+    await db.Tasks.create_index("t_id", unique=True)
+    yield
+    await redis_client.aclose()
+
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.include_router(router)
 
@@ -10,7 +32,15 @@ if __name__ == "__main__":
     """
     Entry point of the application.
 
-    Runs the FastAPI application using Uvicorn server on host 0.0.0.0 and port 8000.
+    Runs the FastAPI application using Uvicorn server on host 0.0.0.0 and port 8000
+    with the uvloop event loop and the httptools HTTP parser.
     The `reload=True` option enables auto-reloading of the server when code changes.
     """
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        reload=True,
+    )
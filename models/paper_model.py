@@ -1,7 +1,7 @@
-from datetime import datetime
-from typing import List, Optional, Any
+from time import time
+from typing import List, Literal, Optional, Any
 
-from pydantic import BaseModel, field_validator, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Question(BaseModel):
@@ -20,30 +20,11 @@ class Question(BaseModel):
 
     question: str
     answer: str
-    type: str
+    type: Literal["short", "long", "multiple_choice"]
     question_slug: str
     reference_id: str
     hint: Optional[str] = None
-    params: Optional[dict] = {}
-
-    @field_validator("type")
-    def validate_question_type(cls, value):
-        """
-        Validates the type of the question.
-
-        Args:
-            value (str): The type of the question.
-
-        Raises:
-            ValueError: If the question type is not one of 'short', 'long', or 'multiple_choice'.
-
-        Returns:
-            str: The validated question type.
-        """
-        allowed_types = {"short", "long", "multiple_choice"}
-        if value not in allowed_types:
-            raise ValueError(f"Question type must be one of {allowed_types}")
-        return value
+    params: Optional[dict] = Field(default_factory=dict)
 
 
 class Section(BaseModel):
@@ -57,28 +38,9 @@ class Section(BaseModel):
     """
 
     marks_per_question: int
-    type: str
+    type: Literal["default", "custom"]
     questions: List[Question]
 
-    @field_validator("type")
-    def validate_section_type(cls, value):
-        """
-        Validates the type of the section.
-
-        Args:
-            value (str): The type of the section.
-
-        Raises:
-            ValueError: If the section type is not 'default' or 'custom'.
-
-        Returns:
-            str: The validated section type.
-        """
-        allowed_types = {"default", "custom"}
-        if value not in allowed_types:
-            raise ValueError(f"Section type must be one of {allowed_types}")
-        return value
-
 
 class PaperParams(BaseModel):
     """
@@ -113,7 +75,7 @@ class SamplePaper(BaseModel):
 
     p_id: Optional[str] = None
     title: str
-    type: str
+    type: Literal["previous_year", "mock", "sample"]
     time: int
     marks: int
     params: PaperParams
@@ -121,25 +83,6 @@ class SamplePaper(BaseModel):
     chapters: List[str]
     sections: List[Section]
 
-    @field_validator("type")
-    def validate_paper_type(cls, value):
-        """
-        Validates the type of the paper.
-
-        Args:
-            value (str): The type of the paper.
-
-        Raises:
-            ValueError: If the paper type is not one of 'previous_year', 'mock', or 'sample'.
-
-        Returns:
-            str: The validated paper type.
-        """
-        allowed_types = {"previous_year", "mock", "sample"}
-        if value not in allowed_types:
-            raise ValueError(f"Paper type must be one of {allowed_types}")
-        return value
-
 
 class StandardResponse(BaseModel):
     """
@@ -152,6 +95,8 @@ class StandardResponse(BaseModel):
         data (Optional[Any]): The data payload included in the response.
     """
 
+    model_config = ConfigDict(extra="ignore")
+
     code: int
     status: str
     message: str
@@ -176,4 +121,4 @@ class Tasks(BaseModel):
     extract_data: Optional[str] = None
     file_path: Optional[str] = None
     file_type: Optional[str] = None
-    datetime: float = Field(default_factory=lambda: datetime.now().now())
+    datetime: float = Field(default_factory=time)
@@ -1,7 +1,7 @@
-import json
+import asyncio
 import uuid
 
-import redis
+import orjson
 from fastapi import APIRouter
 from fastapi import (
     HTTPException,
@@ -10,7 +10,9 @@ from fastapi import (
     File,
     BackgroundTasks,
 )
-from starlette.responses import JSONResponse
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from starlette.responses import Response
 
 from ai_models.ai_api_integration.geminiApi import (
     store_file_in_local_dir,
@@ -18,15 +20,71 @@ from ai_models.ai_api_integration.geminiApi import (
     determine_file_type,
 )
 from config.db_config import papers_collection, db
-from helper.helper import CustomStandard
+from helper.helper import CacheConfig, CustomStandard, envelope_prefix
 from models.paper_model import SamplePaper, Tasks
 
-redis_client = redis.Redis(host="127.0.0.1", port=6379, db=0)
+# Async Redis client so cache I/O does not block the event loop. The client
+# owns its connection pool (rather than being handed one), so aclose() in
+# `main.py`'s shutdown actually disconnects the pooled connections.
+redis_client = Redis(host="127.0.0.1", port=6379, db=0, max_connections=64)
 
 router = APIRouter()
 
+# Compiled once at import so repeated SamplePaper dumps reuse the same
+# pydantic-core serializer instead of re-entering generic dispatch per request.
+SAMPLE_PAPER_TA = TypeAdapter(SamplePaper)
 
-@router.post("/paper", response_model=dict)
+# Pre-serialized StandardResponse envelope for cache hits, built by the same
+# helper as every other response so the two can't drift apart. The cached
+# paper bytes are spliced between the two halves, so a hit returns the stored
+# JSON without parsing or re-serializing it.
+_CACHE_HIT_PREFIX = envelope_prefix(200, "success", "Paper retrieved from cache")
+_CACHE_HIT_SUFFIX = b"}"
+
+
+def _flatten_update(update: dict, prefix: str = "") -> dict:
+    """
+    Flattens a nested patch into dotted-path keys for a MongoDB $set.
+
+    Nested dicts become "parent.child" paths so Mongo rewrites only the
+    touched fields instead of whole subdocuments; lists are replaced
+    wholesale since the patch carries no element indices.
+
+    Args:
+        update (dict): The (possibly nested) fields to update.
+        prefix (str): The dotted path accumulated so far.
+
+    Returns:
+        dict: A single-level mapping of dotted paths to new values.
+    """
+    flat = {}
+    for key, value in update.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(_flatten_update(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+async def _cache_paper(p_id: str, payload: bytes):
+    """
+    Store a serialized paper in the cache along with its expiry.
+
+    Batches the SET and EXPIRE commands in a single pipeline so the cache
+    write costs one Redis round trip instead of two.
+
+    Args:
+        p_id (str): The unique identifier of the paper, used as the cache key.
+        payload (bytes): The serialized paper JSON to be stored.
+    """
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.set(p_id, payload)
+        pipe.expire(p_id, CacheConfig.CACHE_TTL_SECONDS)
+        await pipe.execute()
+
+
+@router.post("/paper")
 async def create_paper(paper: SamplePaper):
     """
     Create a new sample paper and store it in the database.
@@ -35,24 +93,29 @@ async def create_paper(paper: SamplePaper):
         paper (SamplePaper): The data of the sample paper to be created.
 
     Returns:
-        JSONResponse: A response indicating the success of the paper creation
-                      along with the generated paper ID.
+        StandardResponse: A response indicating the success of the paper
+                          creation along with the generated paper ID.
 
     Raises:
         HTTPException: If the paper could not be created, raises a 500 error.
     """
-    paper_dict = paper.model_dump()
-    paper_dict["p_id"] = str(uuid.uuid4())
-    result = await papers_collection.insert_one(paper_dict)
+    paper.p_id = str(uuid.uuid4())
+    paper_dict = SAMPLE_PAPER_TA.dump_python(paper)
+
+    # Dump the cache bytes from the model before the insert mutates the dict,
+    # then run the database write and the cache warm-up concurrently.
+    cache_payload = SAMPLE_PAPER_TA.dump_json(paper)
+    result, _ = await asyncio.gather(
+        papers_collection.insert_one(paper_dict),
+        _cache_paper(paper.p_id, cache_payload),
+    )
 
     if result.inserted_id:
-        return JSONResponse(
-            content=CustomStandard.response(
-                code=200,
-                status="success",
-                message="Sample paper created successfully",
-                data={"paper_id": str(paper_dict.get("p_id"))},
-            )
+        return CustomStandard.response(
+            code=200,
+            status="success",
+            message="Sample paper created successfully",
+            data={"paper_id": paper.p_id},
         )
     else:
         raise HTTPException(status_code=500, detail="Failed to create sample paper")
@@ -68,36 +131,27 @@ async def get_paper(p_id: str):
         p_id (str): The unique identifier of the sample paper.
 
     Returns:
-        JSONResponse: A response containing the paper data if found, either from
-                      cache or the database.
+        StandardResponse: A response containing the paper data if found,
+                          either from cache or the database.
 
     Raises:
         HTTPException: If the paper is not found, raises a 404 error.
     """
-    cached_paper = redis_client.get(p_id)
+    cached_paper = await redis_client.get(p_id)
     if cached_paper:
-        cached_paper_data = json.loads(cached_paper)
-        return JSONResponse(
-            content=CustomStandard.response(
-                code=200,
-                status="success",
-                message="Paper retrieved from cache",
-                data=cached_paper_data,
-            )
+        return Response(
+            content=_CACHE_HIT_PREFIX + cached_paper + _CACHE_HIT_SUFFIX,
+            media_type="application/json",
         )
 
-    paper = await db.papers.find_one({"p_id": p_id})
+    paper = await db.papers.find_one({"p_id": p_id}, projection={"_id": 0})
     if paper:
-        paper.pop("_id")
-
-        redis_client.set(p_id, json.dumps(paper))
-        return JSONResponse(
-            content=CustomStandard.response(
-                code=200,
-                status="success",
-                message="Paper retrieved from database",
-                data=paper,
-            )
+        await _cache_paper(p_id, orjson.dumps(paper))
+        return CustomStandard.response(
+            code=200,
+            status="success",
+            message="Paper retrieved from database",
+            data=paper,
         )
     raise HTTPException(status_code=404, detail="Paper not found")
 
@@ -112,35 +166,55 @@ async def update_paper(p_id: str, paper: dict = Body(...)):
         paper (dict): The fields to be updated along with their new values.
 
     Returns:
-        JSONResponse: A response indicating the success of the paper update,
-                      including the updated paper data.
+        StandardResponse: A response indicating the success of the paper
+                          update, including the updated paper data.
 
     Raises:
         HTTPException: If the paper is not found, raises a 404 error.
     """
-    existing_paper = await db.papers.find_one({"p_id": p_id})
+    existing_paper = await db.papers.find_one({"p_id": p_id}, projection={"_id": 0})
     if not existing_paper:
         raise HTTPException(status_code=404, detail="Paper not found")
 
-    current_paper = SamplePaper(**existing_paper)
-    for field, value in paper.items():
-        if hasattr(current_paper, field):
-            setattr(current_paper, field, value)
+    # The stored document was validated when it was written, so rebuild the
+    # model without re-validating the whole nested sections/questions tree,
+    # then validate just the incoming fields as they are assigned.
+    current_paper = SamplePaper.model_construct(**existing_paper)
+    updates = {
+        field: value
+        for field, value in paper.items()
+        if field in SamplePaper.model_fields
+    }
+    if not updates:
+        raise HTTPException(status_code=422, detail="No valid fields to update")
     try:
-        updated_paper = current_paper.model_dump()
+        for field, value in updates.items():
+            SamplePaper.__pydantic_validator__.validate_assignment(
+                current_paper, field, value
+            )
+        # warnings=False: untouched nested fields are still the plain dicts
+        # model_construct left in place, which the serializer handles fine.
+        updated_paper = SAMPLE_PAPER_TA.dump_python(current_paper, warnings=False)
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
 
-    await db.papers.update_one({"p_id": p_id}, {"$set": paper})
-    redis_client.set(p_id, json.dumps(updated_paper))
+    # The database update and the cache refresh are independent round trips;
+    # issue them concurrently instead of paying for both sequentially. The
+    # $set document comes from the validated dump, not the raw body, so Mongo
+    # sees the same coerced values as the cache and the response.
+    validated_updates = {field: updated_paper[field] for field in updates}
+    await asyncio.gather(
+        db.papers.update_one(
+            {"p_id": p_id}, {"$set": _flatten_update(validated_updates)}
+        ),
+        _cache_paper(p_id, SAMPLE_PAPER_TA.dump_json(current_paper, warnings=False)),
+    )
 
-    return JSONResponse(
-        content=CustomStandard.response(
-            code=200,
-            status="success",
-            message="Paper updated successfully",
-            data=updated_paper,
-        )
+    return CustomStandard.response(
+        code=200,
+        status="success",
+        message="Paper updated successfully",
+        data=updated_paper,
     )
 
 
@@ -153,19 +227,21 @@ async def delete_paper(paper_id: str):
         paper_id (str): The unique identifier of the paper to be deleted.
 
     Returns:
-        JSONResponse: A response indicating the success of the deletion.
+        StandardResponse: A response indicating the success of the deletion.
 
     Raises:
         HTTPException: If the paper is not found, raises a 404 error.
     """
-    result = await db.papers.delete_one({"p_id": paper_id})
+    # Deleting a missing cache key is a no-op, so the cache invalidation can
+    # run concurrently with the database delete.
+    result, _ = await asyncio.gather(
+        db.papers.delete_one({"p_id": paper_id}),
+        redis_client.delete(paper_id),
+    )
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Paper not found")
-    redis_client.delete(paper_id)
-    return JSONResponse(
-        content=CustomStandard.response(
-            code=200, status="success", message="Paper deleted successfully"
-        )
+    return CustomStandard.response(
+        code=200, status="success", message="Paper deleted successfully"
     )
 
 
@@ -202,7 +278,7 @@ async def process_Data(file_path, task_id, file_type):
         )
 
 
-@router.post("/extract/text")
+@router.post("/extract/text", status_code=202)
 async def extract_text(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
@@ -215,33 +291,41 @@ async def extract_text(
         file (UploadFile): The file to be processed.
 
     Returns:
-        JSONResponse: A response indicating the start of the text extraction process.
+        StandardResponse: A response indicating the start of the text extraction process.
     """
     task_id = str(uuid.uuid4())
-    file_content = await file.read()
-
-    file_path = await store_file_in_local_dir(file_content, file.filename)
-
     file_type = determine_file_type(file.filename)
 
     await db.Tasks.insert_one(
         Tasks(
             t_id=task_id,
             task_status="processing",
-            file_path=file_path,
             file_type=file_type,
         ).model_dump(exclude={"extract_data"})
     )
 
+    # The upload must be streamed to disk before the handler returns:
+    # Starlette closes form files once the response is sent, so a background
+    # task can no longer read them. Only the extraction itself is deferred.
+    try:
+        file_path = await store_file_in_local_dir(file, file.filename)
+        await db.Tasks.update_one(
+            {"t_id": task_id}, {"$set": {"file_path": file_path}}
+        )
+    except Exception as e:
+        await db.Tasks.update_one(
+            {"t_id": task_id},
+            {"$set": {"task_status": "failed", "extract_data": str(e)}},
+        )
+        raise HTTPException(status_code=500, detail="Failed to store uploaded file")
+
     background_tasks.add_task(process_Data, file_path, task_id, file_type)
 
-    return JSONResponse(
-        content=CustomStandard.response(
-            code=202,
-            status="processing",
-            message=f"{file_type.upper()} extraction started",
-            data={"task_id": task_id},
-        ),
+    return CustomStandard.response(
+        code=202,
+        status="processing",
+        message=f"{file_type.upper()} extraction started",
+        data={"task_id": task_id},
     )
 
 
@@ -254,19 +338,17 @@ async def get_task_status(task_id: str):
         task_id (str): The unique identifier of the task.
 
     Returns:
-        JSONResponse: A response containing the current status of the task.
+        StandardResponse: A response containing the current status of the task.
 
     Raises:
         HTTPException: If the task is not found, raises a 404 error.
     """
-    task = await db.Tasks.find_one({"t_id": task_id})
+    task = await db.Tasks.find_one({"t_id": task_id}, projection={"_id": 0})
     if task:
-        return JSONResponse(
-            content=CustomStandard.response(
-                code=200,
-                status="success",
-                message="Task status retrieved",
-                data={"status": task["task_status"]},
-            )
+        return CustomStandard.response(
+            code=200,
+            status="success",
+            message="Task status retrieved",
+            data={"status": task["task_status"]},
         )
     raise HTTPException(status_code=404, detail="Task not found")